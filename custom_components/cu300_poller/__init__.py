@@ -12,7 +12,9 @@ from .const import (
     DOMAIN,
     CONNECTION_TYPE_SERIAL,
     CONNECTION_TYPE_TCP,
+    CONF_BAUDRATE,
     CONF_UPDATE_INTERVAL,
+    DEFAULT_BAUDRATE,
     DEFAULT_UPDATE_INTERVAL,
 )
 from .coordinator import CU300Coordinator
@@ -72,31 +74,48 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     host = entry.data.get(CONF_HOST)
     port = entry.data.get(CONF_PORT)
     update_interval = entry.data.get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL)
+    baudrate = entry.data.get(CONF_BAUDRATE, DEFAULT_BAUDRATE)
 
-    # Create coordinator
-    coordinator = CU300Coordinator(
-        hass,
-        connection_type=connection_type,
-        host=host,
-        port=port,
-        update_interval=update_interval,
-    )
+    # Reuse an existing coordinator when another entry already talks to
+    # the same device — a serial port can only be opened once, and one
+    # poll cycle can feed any number of entries.
+    hass.data.setdefault(DOMAIN, {})
+    connections: dict = hass.data[DOMAIN].setdefault("_connections", {})
+    connection_key = (connection_type, host, port)
+    shared = connections.get(connection_key)
+
+    if shared is not None:
+        coordinator = shared["coordinator"]
+        shared["refs"] += 1
+        _LOGGER.debug("Reusing CU300 connection for %s", connection_key)
+    else:
+        coordinator = CU300Coordinator(
+            hass,
+            connection_type=connection_type,
+            host=host,
+            port=port,
+            update_interval=update_interval,
+            baudrate=baudrate,
+        )
 
-    # Set up connection
-    try:
-        await coordinator.async_setup()
-    except ConfigEntryNotReady as err:
-        _LOGGER.error("Failed to set up CU300: %s", err)
-        raise
+        # Set up connection
+        try:
+            await coordinator.async_setup()
+        except ConfigEntryNotReady as err:
+            _LOGGER.error("Failed to set up CU300: %s", err)
+            raise
 
-    # Perform initial data fetch
-    await coordinator.async_config_entry_first_refresh()
+        connections[connection_key] = {"coordinator": coordinator, "refs": 1}
 
     # Store coordinator
-    hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = coordinator
 
-    # Set up platforms
+    # Fetch initial data before forwarding the platforms: if the first
+    # refresh raises ConfigEntryNotReady while a concurrent forward is
+    # still running, HA's setup retry would forward the platforms a
+    # second time and collide on unique_ids
+    if shared is None:
+        await coordinator.async_config_entry_first_refresh()
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
     # Register services
@@ -148,15 +167,33 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
     if unload_ok:
-        # Shutdown coordinator
         coordinator: CU300Coordinator = hass.data[DOMAIN][entry.entry_id]
-        await coordinator.async_shutdown()
+
+        # Only shut the connection down once no other entry references it
+        connections: dict = hass.data[DOMAIN].get("_connections", {})
+        connection_key = (
+            coordinator.connection_type,
+            coordinator.host,
+            coordinator.port,
+        )
+        shared = connections.get(connection_key)
+        if shared is not None:
+            shared["refs"] -= 1
+            if shared["refs"] <= 0:
+                del connections[connection_key]
+                await coordinator.async_shutdown()
+        else:
+            await coordinator.async_shutdown()
 
         # Remove entry data
         hass.data[DOMAIN].pop(entry.entry_id)
 
-        # Remove services if this is the last entry
-        if not hass.data[DOMAIN]:
+        # Remove services if this is the last entry; skip bookkeeping
+        # keys ("_connections", "yaml_config") that outlive entries
+        if not any(
+            isinstance(value, CU300Coordinator)
+            for value in hass.data[DOMAIN].values()
+        ):
             hass.services.async_remove(DOMAIN, "start_pump")
             hass.services.async_remove(DOMAIN, "stop_pump")
             hass.services.async_remove(DOMAIN, "set_reference")
@@ -3,6 +3,8 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
+from functools import lru_cache
 from typing import Any
 
 import voluptuous as vol
@@ -17,13 +19,69 @@ from .const import (
     DOMAIN,
     CONNECTION_TYPE_SERIAL,
     CONNECTION_TYPE_TCP,
+    CONF_BAUDRATE,
     CONF_UPDATE_INTERVAL,
+    BAUDRATES,
+    DEFAULT_BAUDRATE,
     DEFAULT_UPDATE_INTERVAL,
     DEFAULT_TCP_PORT,
 )
+from .genibus.exceptions import ConnectionError as CU300ConnectionError
+from .genibus.protocol import CU300Protocol
 
 _LOGGER = logging.getLogger(__name__)
 
+# TTL for remembering successful probes (see _test_connection). We cache
+# timestamps in hass.data rather than pooling open connections: a serial
+# port is exclusive and must not be held away from the integration, and
+# config entries already share one live protocol via the "_connections"
+# registry in __init__.py, so the first poll never re-handshakes.
+_PROBE_CACHE_TTL = 60  # seconds
+
+# Form schemas, compiled once at import instead of per form render
+_USER_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_TYPE, default=CONNECTION_TYPE_SERIAL): vol.In(
+            {
+                CONNECTION_TYPE_SERIAL: "Serial",
+                CONNECTION_TYPE_TCP: "TCP",
+            }
+        ),
+    }
+)
+
+_SERIAL_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_PORT, default="/dev/ttyUSB0"): str,
+        vol.Optional(CONF_BAUDRATE, default=DEFAULT_BAUDRATE): vol.In(BAUDRATES),
+        vol.Optional(
+            CONF_UPDATE_INTERVAL, default=DEFAULT_UPDATE_INTERVAL
+        ): cv.positive_int,
+    }
+)
+
+_TCP_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_HOST): str,
+        vol.Required(CONF_PORT, default=DEFAULT_TCP_PORT): cv.port,
+        vol.Optional(
+            CONF_UPDATE_INTERVAL, default=DEFAULT_UPDATE_INTERVAL
+        ): cv.positive_int,
+    }
+)
+
+
+@lru_cache(maxsize=8)
+def _options_schema(update_interval: int) -> vol.Schema:
+    """Return the options schema for the given current interval."""
+    return vol.Schema(
+        {
+            vol.Optional(
+                CONF_UPDATE_INTERVAL, default=update_interval
+            ): cv.positive_int,
+        }
+    )
+
 
 class CU300ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for CU300 Poller."""
@@ -47,19 +105,7 @@ class CU300ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             return await self.async_step_tcp()
 
         # Show connection type selection form
-        return self.async_show_form(
-            step_id="user",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(CONF_TYPE, default=CONNECTION_TYPE_SERIAL): vol.In(
-                        {
-                            CONNECTION_TYPE_SERIAL: "Serial",
-                            CONNECTION_TYPE_TCP: "TCP",
-                        }
-                    ),
-                }
-            ),
-        )
+        return self.async_show_form(step_id="user", data_schema=_USER_SCHEMA)
 
     async def async_step_serial(
         self, user_input: dict[str, Any] | None = None
@@ -96,14 +142,7 @@ class CU300ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         # Show serial configuration form
         return self.async_show_form(
             step_id="serial",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(CONF_PORT, default="/dev/ttyUSB0"): str,
-                    vol.Optional(
-                        CONF_UPDATE_INTERVAL, default=DEFAULT_UPDATE_INTERVAL
-                    ): cv.positive_int,
-                }
-            ),
+            data_schema=_SERIAL_SCHEMA,
             errors=errors,
         )
 
@@ -142,36 +181,28 @@ class CU300ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         # Show TCP configuration form
         return self.async_show_form(
             step_id="tcp",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(CONF_HOST): str,
-                    vol.Required(CONF_PORT, default=DEFAULT_TCP_PORT): cv.port,
-                    vol.Optional(
-                        CONF_UPDATE_INTERVAL, default=DEFAULT_UPDATE_INTERVAL
-                    ): cv.positive_int,
-                }
-            ),
+            data_schema=_TCP_SCHEMA,
             errors=errors,
         )
 
     async def _test_connection(self, config: dict[str, Any]) -> None:
         """Test if we can connect to the device."""
         try:
-            # Log the config we received
-            _LOGGER.debug("Testing connection with config: %s", config)
-            _LOGGER.debug("CONF_TYPE = '%s', value = %s", CONF_TYPE, config.get(CONF_TYPE))
-            _LOGGER.debug("CONF_PORT = '%s', value = %s", CONF_PORT, config.get(CONF_PORT))
-            _LOGGER.debug("CONF_HOST = '%s', value = %s", CONF_HOST, config.get(CONF_HOST))
-            
-            # Import here to avoid issues if library isn't installed yet
-            from .genibus.protocol import CU300Protocol
-            from .genibus.exceptions import ConnectionError as CU300ConnectionError
-
-            # Get connection parameters
+            # Get connection parameters once instead of re-fetching them
+            # from the dict at every use below
             connection_type = config.get(CONF_TYPE)
             host = config.get(CONF_HOST)
             port = config.get(CONF_PORT)
-            
+
+            # Log the config we received; skip building the records
+            # entirely when debug logging is off
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("Testing connection with config: %s", config)
+                _LOGGER.debug("CONF_TYPE = '%s', value = %s", CONF_TYPE, connection_type)
+                _LOGGER.debug("CONF_PORT = '%s', value = %s", CONF_PORT, port)
+                _LOGGER.debug("CONF_HOST = '%s', value = %s", CONF_HOST, host)
+
+
             # Validate we have required parameters
             if connection_type == CONNECTION_TYPE_SERIAL and not port:
                 _LOGGER.error("Serial connection requires port, but got: %s", port)
@@ -180,7 +211,18 @@ class CU300ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             if connection_type == CONNECTION_TYPE_TCP and (not host or not port):
                 _LOGGER.error("TCP connection requires host and port, got host=%s, port=%s", host, port)
                 raise CannotConnect("Host and port required for TCP connection")
-            
+
+            # Skip the handshake if this target was probed successfully
+            # a moment ago (e.g. the user navigated back and resubmitted)
+            probe_cache: dict = self.hass.data.setdefault(DOMAIN, {}).setdefault(
+                "probe_cache", {}
+            )
+            cache_key = (connection_type, host, port)
+            stamp = probe_cache.get(cache_key)
+            if stamp is not None and time.monotonic() - stamp < _PROBE_CACHE_TTL:
+                _LOGGER.debug("Reusing recent successful probe for %s", cache_key)
+                return
+
             # Log what we're trying to connect to
             _LOGGER.info(
                 "Testing connection: type=%s, host=%s, port=%s",
@@ -193,14 +235,17 @@ class CU300ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 connection_type=connection_type,
                 host=host,
                 port=port,
+                baudrate=config.get(CONF_BAUDRATE, DEFAULT_BAUDRATE),
             )
 
             # Try to connect with timeout
-            await asyncio.wait_for(protocol.connect(), timeout=15)
+            async with asyncio.timeout(15):
+                await protocol.connect()
             
             # Disconnect after successful test
             await protocol.disconnect()
-            
+
+            probe_cache[cache_key] = time.monotonic()
             _LOGGER.info("Connection test successful")
 
         except asyncio.TimeoutError as err:
@@ -209,9 +254,6 @@ class CU300ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         except CU300ConnectionError as err:
             _LOGGER.error("Connection test failed: %s", err)
             raise CannotConnect from err
-        except ImportError as err:
-            _LOGGER.error("Failed to import protocol library: %s", err)
-            raise CannotConnect from err
         except Exception as err:
             _LOGGER.exception("Unexpected error during connection test")
             raise CannotConnect from err
@@ -239,21 +281,13 @@ class CU300OptionsFlow(config_entries.OptionsFlow):
         if user_input is not None:
             return self.async_create_entry(title="", data=user_input)
 
+        update_interval = self.config_entry.options.get(
+            CONF_UPDATE_INTERVAL,
+            self.config_entry.data.get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL),
+        )
         return self.async_show_form(
             step_id="init",
-            data_schema=vol.Schema(
-                {
-                    vol.Optional(
-                        CONF_UPDATE_INTERVAL,
-                        default=self.config_entry.options.get(
-                            CONF_UPDATE_INTERVAL,
-                            self.config_entry.data.get(
-                                CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL
-                            ),
-                        ),
-                    ): cv.positive_int,
-                }
-            ),
+            data_schema=_options_schema(update_interval),
         )
 
 
@@ -10,12 +10,27 @@ CONNECTION_TYPE_TCP = "tcp"
 CONF_UPDATE_INTERVAL = "update_interval"
 CONF_DEVICE_ADDRESS = "device_address"
 CONF_SOURCE_ADDRESS = "source_address"
+CONF_BAUDRATE = "baudrate"
 
 # Default values
 DEFAULT_UPDATE_INTERVAL = 30  # seconds
+DEFAULT_BAUDRATE = 9600
+BAUDRATES = [9600, 19200, 38400]
 DEFAULT_DEVICE_ADDRESS = 0x20
 DEFAULT_SOURCE_ADDRESS = 0x04
 DEFAULT_TCP_PORT = 502
 
 # Attributes
 ATTR_REFERENCE = "reference"
+
+# Keys of the coordinator's data dict, shared between the protocol
+# payload and every platform. Using the same interned constants keeps
+# the hot dict lookups on the cached-hash fast path and rules out key
+# typos across modules.
+KEY_HEAD = "head"
+KEY_FLOW = "flow"
+KEY_SPEED = "speed"
+KEY_POWER = "power"
+KEY_ALARM_CODE = "alarm_code"
+KEY_ACT_MODE1 = "act_mode1"
+KEY_REFERENCE = "reference"
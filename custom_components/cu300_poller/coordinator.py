@@ -1,6 +1,7 @@
 """Data update coordinator for CU300 Poller."""
 import asyncio
 import logging
+import random
 from datetime import timedelta
 from typing import Any
 
@@ -14,6 +15,10 @@ from .genibus.exceptions import ProtocolError, ConnectionError as CU300Connectio
 
 _LOGGER = logging.getLogger(__name__)
 
+# Reconnect backoff parameters (seconds)
+RECONNECT_BACKOFF_BASE = 5
+RECONNECT_BACKOFF_MAX = 600
+
 class CU300Coordinator(DataUpdateCoordinator):
     """Coordinator to manage CU300 data updates."""
 
@@ -24,6 +29,7 @@ class CU300Coordinator(DataUpdateCoordinator):
         host: str | None = None,
         port: str | None = None,
         update_interval: int = 30,
+        baudrate: int = 9600,
     ) -> None:
         """Initialize the coordinator."""
         super().__init__(
@@ -31,13 +37,21 @@ class CU300Coordinator(DataUpdateCoordinator):
             _LOGGER,
             name=DOMAIN,
             update_interval=timedelta(seconds=update_interval),
+            # The payload is a flat dict of scalars, so equality is
+            # cheap; skip notifying listeners when a poll returns the
+            # same values as the last one
+            always_update=False,
         )
         self.connection_type = connection_type
         self.host = host
         self.port = port
+        self.baudrate = baudrate
         self.protocol: CU300Protocol | None = None
         self._reconnect_task: asyncio.Task | None = None
-        self._connected = False
+        self._reconnect_attempt = 0
+        # Set while the link is up; commands wait on it briefly instead
+        # of failing outright during a reconnect window
+        self._conn_ready = asyncio.Event()
 
     async def async_setup(self) -> None:
         """Set up the coordinator and establish connection."""
@@ -46,9 +60,14 @@ class CU300Coordinator(DataUpdateCoordinator):
                 connection_type=self.connection_type,
                 host=self.host,
                 port=self.port,
+                baudrate=self.baudrate,
             )
-            await asyncio.wait_for(self.protocol.connect(), timeout=15)
-            self._connected = True
+            # asyncio.timeout avoids the wrapper Task that wait_for
+            # spawns per call
+            async with asyncio.timeout(15):
+                await self.protocol.connect()
+            self._conn_ready.set()
+            self._reconnect_attempt = 0
             _LOGGER.info(
                 "Successfully connected to CU300 at %s",
                 self.port or f"{self.host}:{self.port}",
@@ -64,24 +83,30 @@ class CU300Coordinator(DataUpdateCoordinator):
             raise ConfigEntryNotReady(f"Setup failed: {err}") from err
 
     async def _async_update_data(self) -> dict[str, Any]:
-        """Fetch data from CU300."""
-        if not self._connected:
-            _LOGGER.warning("Not connected, attempting to reconnect")
-            await self._async_reconnect()
-            if not self._connected:
-                raise UpdateFailed("Not connected to CU300")
+        """Fetch data from CU300.
+
+        poll_data builds a fresh dict every cycle and the coordinator
+        installs it as a single reference swap, so entity properties
+        read the latest snapshot without taking any lock; the protocol
+        lock only serializes traffic on the bus itself.
+        """
+        if not self._conn_ready.is_set():
+            # Reconnection runs in the single background task; waiting
+            # on it here would block the refresh for the full backoff
+            # delay and race a second teardown/handshake cycle
+            _LOGGER.warning("Not connected, reconnect pending")
+            self._schedule_reconnect()
+            raise UpdateFailed("Not connected to CU300")
 
         try:
-            data = await asyncio.wait_for(
-                self.protocol.poll_data(),
-                timeout=10,
-            )
+            async with asyncio.timeout(10):
+                data = await self.protocol.poll_data()
             _LOGGER.debug("Successfully polled data: %s", data)
             return data
 
         except asyncio.TimeoutError:
             _LOGGER.error("Timeout polling CU300 data")
-            self._connected = False
+            self._conn_ready.clear()
             self._schedule_reconnect()
             raise UpdateFailed("Timeout polling data")
 
@@ -91,7 +116,7 @@ class CU300Coordinator(DataUpdateCoordinator):
 
         except CU300ConnectionError as err:
             _LOGGER.error("Connection error: %s", err)
-            self._connected = False
+            self._conn_ready.clear()
             self._schedule_reconnect()
             raise UpdateFailed(f"Connection error: {err}")
 
@@ -100,24 +125,60 @@ class CU300Coordinator(DataUpdateCoordinator):
             raise UpdateFailed(f"Unexpected error: {err}")
 
     async def _async_reconnect(self) -> None:
-        """Attempt to reconnect to the device."""
+        """Attempt to reconnect to the device.
+
+        Only runs inside the task created by _schedule_reconnect, so at
+        most one teardown/handshake cycle is ever in flight and the
+        backoff delay below never blocks a scheduled refresh.
+        """
         if self.protocol is None:
             return
 
+        # Exponential backoff with jitter so repeated failures don't hammer
+        # the device (or a flaky serial/TCP link) in lockstep.
+        if self._reconnect_attempt:
+            delay = min(
+                RECONNECT_BACKOFF_BASE * (2 ** self._reconnect_attempt)
+                + random.uniform(0, RECONNECT_BACKOFF_BASE),
+                RECONNECT_BACKOFF_MAX,
+            )
+            _LOGGER.debug(
+                "Waiting %.1f seconds before reconnect attempt %d",
+                delay,
+                self._reconnect_attempt + 1,
+            )
+            await asyncio.sleep(delay)
+
         try:
+            # A transient blip often leaves the transport usable; probe
+            # it cheaply before paying for a full teardown and handshake
+            if await self.protocol.ping():
+                self._conn_ready.set()
+                self._reconnect_attempt = 0
+                _LOGGER.info("CU300 link recovered without full reconnect")
+                return
+
             _LOGGER.info("Attempting to reconnect to CU300")
-            await asyncio.wait_for(self.protocol.reconnect(), timeout=15)
-            self._connected = True
+            async with asyncio.timeout(15):
+                await self.protocol.reconnect()
+            self._conn_ready.set()
+            self._reconnect_attempt = 0
             _LOGGER.info("Successfully reconnected to CU300")
         except Exception as err:
             _LOGGER.error("Failed to reconnect: %s", err)
-            self._connected = False
+            self._conn_ready.clear()
+            self._reconnect_attempt += 1
 
     def _schedule_reconnect(self) -> None:
         """Schedule a reconnection attempt."""
+        # The done() check already collapses failure bursts into one
+        # task; eager_start additionally runs the coroutine up to its
+        # first await right away instead of waiting a loop iteration,
+        # so a second failure in the same iteration sees it as pending.
         if self._reconnect_task is None or self._reconnect_task.done():
             self._reconnect_task = self.hass.async_create_task(
-                self._async_reconnect()
+                self._async_reconnect(),
+                eager_start=True,
             )
 
     async def async_shutdown(self) -> None:
@@ -136,47 +197,66 @@ class CU300Coordinator(DataUpdateCoordinator):
             except Exception as err:
                 _LOGGER.error("Error disconnecting: %s", err)
 
+    def _async_set_optimistic(self, **values: Any) -> None:
+        """Push expected values to listeners ahead of the next poll."""
+        if self.data is None:
+            return
+        self.async_set_updated_data({**self.data, **values})
+
+    async def _async_wait_connected(self, timeout: int = 10) -> None:
+        """Wait for the link to be up before issuing a command.
+
+        Lets a command arriving during a reconnect window wait for the
+        link instead of failing immediately on a stale flag.
+        """
+        if self.protocol is None:
+            raise UpdateFailed("Not connected to CU300")
+        if self._conn_ready.is_set():
+            return
+        try:
+            async with asyncio.timeout(timeout):
+                await self._conn_ready.wait()
+        except asyncio.TimeoutError as err:
+            raise UpdateFailed("Not connected to CU300") from err
+
     async def async_start_pump(self) -> None:
         """Start the pump."""
-        if not self._connected or self.protocol is None:
-            raise UpdateFailed("Not connected to CU300")
+        await self._async_wait_connected()
 
         try:
-            await asyncio.wait_for(self.protocol.start_pump(), timeout=5)
+            async with asyncio.timeout(5):
+                await self.protocol.start_pump()
             _LOGGER.info("Pump started successfully")
-            # Request immediate update
-            await self.async_request_refresh()
+            # Update entities immediately; the next poll reconciles
+            self._async_set_optimistic(act_mode1=1)
         except Exception as err:
             _LOGGER.error("Failed to start pump: %s", err)
             raise UpdateFailed(f"Failed to start pump: {err}")
 
     async def async_stop_pump(self) -> None:
         """Stop the pump."""
-        if not self._connected or self.protocol is None:
-            raise UpdateFailed("Not connected to CU300")
+        await self._async_wait_connected()
 
         try:
-            await asyncio.wait_for(self.protocol.stop_pump(), timeout=5)
+            async with asyncio.timeout(5):
+                await self.protocol.stop_pump()
             _LOGGER.info("Pump stopped successfully")
-            # Request immediate update
-            await self.async_request_refresh()
+            # Update entities immediately; the next poll reconciles
+            self._async_set_optimistic(act_mode1=0)
         except Exception as err:
             _LOGGER.error("Failed to stop pump: %s", err)
             raise UpdateFailed(f"Failed to stop pump: {err}")
 
     async def async_set_reference(self, value: int) -> None:
         """Set reference value."""
-        if not self._connected or self.protocol is None:
-            raise UpdateFailed("Not connected to CU300")
+        await self._async_wait_connected()
 
         try:
-            await asyncio.wait_for(
-                self.protocol.set_reference(value),
-                timeout=5,
-            )
+            async with asyncio.timeout(5):
+                await self.protocol.set_reference(value)
             _LOGGER.info("Reference set to %s successfully", value)
-            # Request immediate update
-            await self.async_request_refresh()
+            # Update entities immediately; the next poll reconciles
+            self._async_set_optimistic(reference=value)
         except Exception as err:
             _LOGGER.error("Failed to set reference: %s", err)
             raise UpdateFailed(f"Failed to set reference: {err}")
@@ -184,4 +264,4 @@ class CU300Coordinator(DataUpdateCoordinator):
     @property
     def connected(self) -> bool:
         """Return connection status."""
-        return self._connected
+        return self._conn_ready.is_set()
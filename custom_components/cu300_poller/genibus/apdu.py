@@ -27,6 +27,9 @@ with this program; if not, write to the Free Software Foundation, Inc.,
 """
 
 import logging
+import struct
+from functools import lru_cache
+from typing import NamedTuple
 
 from .devices.db import DeviceDB
 from . import gbdefs as defs
@@ -37,30 +40,51 @@ logger = logging.getLogger("Genibus")
 
 db = DeviceDB()
 
+@lru_cache(maxsize=None)
+def _items(klass):
+    """Data items for an APDU class; static per device family, so every
+    PDU built or parsed can share one lookup instead of querying the DB."""
+    return db.dataitemsByClass("magna", klass)
+
 class APDU(BaseObject):
+    # Shared device DB; no reason to construct one per parsed frame
+    _db = db
+
     def __init__(self):
         super().__init__()
         self._data = {}
         self._raw = None
-        self._device_db = DeviceDB()
 
     @classmethod
     def from_bytes(cls, data):
         apdu = cls()
-        apdu._raw = data
         apdu._data = {}
+        # Keep the raw frame only while debugging; retaining it on every
+        # parsed APDU pins the buffer for the object's lifetime. Copy it
+        # so a view into a reused receive buffer stays meaningful.
+        if logger.isEnabledFor(logging.DEBUG):
+            apdu._raw = bytes(data)
+        # A frame is SD + length byte + payload + 2 CRC bytes, so it
+        # must span length + 4 bytes; reject truncated input on the
+        # cheap header check before walking the whole buffer for a CRC
+        if len(data) < 5 or len(data) < data[1] + 4:
+            logger.error("Truncated frame: %d bytes", len(data))
+            return None
+        # Work on a memoryview so the CRC check and the unpack below are
+        # pointer arithmetic over the caller's buffer, never slice copies
+        mv = data if isinstance(data, memoryview) else memoryview(data)
         # Simplified parsing (adapt from GENIBus library)
-        if not crc.check_tel(data, silent=True):
+        if not crc.check_tel(mv, silent=True):
             logger.error("Invalid CRC in APDU response")
             return None
         # Example parsing: map response to data items (head, flow, etc.)
-        di = db.dataitemsByClass("magna", defs.APDUClass.MEASURED_DATA)
-        offset = 4  # Skip header
-        for item_name, item in di.items():
-            if offset + 1 < len(data):
-                value = data[offset]  # Simplified; adjust based on actual format
-                apdu._data[item_name] = value
-                offset += 1
+        # One unpack_from call pulls every byte out in C instead of a
+        # Python-level loop with a bounds check per item.
+        di = _items(defs.APDUClass.MEASURED_DATA)
+        count = min(len(di), max(len(mv) - 5, 0))
+        if count:
+            values = struct.unpack_from(f"{count}B", mv, 4)  # Skip header
+            apdu._data = dict(zip(di, values))
         return apdu
 
     def get_value(self, key):
@@ -70,110 +94,91 @@ def createAPDUHeader(apdu, klass, operationSpecifier, length):
     apdu.append(klass)
     apdu.append((operationSpecifier << 6) | (length & 0x3F))
 
-def createAPDU(klass, op, datapoints):
-    di = db.dataitemsByClass("magna", klass)
-    result = []
-    createAPDUHeader(result, klass, op, len(datapoints) * 2)
+# The APDU writers below append into the caller's bytearray so a whole
+# PDU is assembled in one buffer; their encoded sizes are fixed
+# (2-byte header plus one id byte — or id/value pair — per datapoint),
+# letting the PDU builders compute the length field up front.
+
+def createAPDU(klass, op, datapoints, buf):
+    di = _items(klass)
+    createAPDUHeader(buf, klass, op, len(datapoints) * 2)
     for dp, value in datapoints:
         item = di[dp]
-        result.append(item.id)
-        result.append(value)
-    return result
-
-def createAPDUNoData(klass, op, datapoints):
-    di = db.dataitemsByClass("magna", klass)
-    result = []
-    createAPDUHeader(result, klass, op, len(datapoints))
+        buf.append(item.id)
+        buf.append(value)
+    return buf
+
+def createAPDUNoData(klass, op, datapoints, buf):
+    di = _items(klass)
+    createAPDUHeader(buf, klass, op, len(datapoints))
     for dp in datapoints:
         item = di[dp]
-        result.append(item.id)
-    return result
+        buf.append(item.id)
+    return buf
 
-def createGetInfoAPDU(klass, datapoints):
-    result = createAPDUNoData(klass, defs.Operation.INFO, datapoints)
-    return result
+def createGetInfoAPDU(klass, datapoints, buf):
+    return createAPDUNoData(klass, defs.Operation.INFO, datapoints, buf)
 
-def createGetMeasuredDataAPDU(klass, datapoints):
-    result = createAPDUNoData(klass, defs.Operation.GET, datapoints)
-    return result
+def createGetMeasuredDataAPDU(klass, datapoints, buf):
+    return createAPDUNoData(klass, defs.Operation.GET, datapoints, buf)
 
-def createSetCommandsAPDU(datapoints):
-    result = createAPDUNoData(defs.APDUClass.COMMANDS, defs.Operation.SET, datapoints)
-    return result
+def createSetCommandsAPDU(datapoints, buf):
+    return createAPDUNoData(defs.APDUClass.COMMANDS, defs.Operation.SET, datapoints, buf)
 
-def createGetReferencesAPDU(datapoints):
-    result = createAPDUNoData(defs.APDUClass.REFERENCE_VALUES, defs.Operation.GET, datapoints)
-    return result
+def createGetReferencesAPDU(datapoints, buf):
+    return createAPDUNoData(defs.APDUClass.REFERENCE_VALUES, defs.Operation.GET, datapoints, buf)
 
-def createSetReferencesAPDU(datapoints):
-    result = createAPDU(defs.APDUClass.REFERENCE_VALUES, defs.Operation.SET, datapoints)
-    return result
+def createSetReferencesAPDU(datapoints, buf):
+    return createAPDU(defs.APDUClass.REFERENCE_VALUES, defs.Operation.SET, datapoints, buf)
 
-def createGetStringsAPDU(datapoints):
-    result = createAPDUNoData(defs.APDUClass.ASCII_STRINGS, defs.Operation.GET, datapoints)
-    return result
+def createGetStringsAPDU(datapoints, buf):
+    return createAPDUNoData(defs.APDUClass.ASCII_STRINGS, defs.Operation.GET, datapoints, buf)
 
-def createGetParametersAPDU(datapoints):
-    result = createAPDUNoData(defs.APDUClass.CONFIGURATION_PARAMETERS, defs.Operation.GET, datapoints)
-    return result
+def createGetParametersAPDU(datapoints, buf):
+    return createAPDUNoData(defs.APDUClass.CONFIGURATION_PARAMETERS, defs.Operation.GET, datapoints, buf)
 
-def createSetParametersAPDU(datapoints):
-    result = createAPDU(defs.APDUClass.CONFIGURATION_PARAMETERS, defs.Operation.SET, datapoints)
-    return result
+def createSetParametersAPDU(datapoints, buf):
+    return createAPDU(defs.APDUClass.CONFIGURATION_PARAMETERS, defs.Operation.SET, datapoints, buf)
 
-def createGetProtocolDataAPDU(datapoints):
-    result = createAPDUNoData(defs.APDUClass.PROTOCOL_DATA, defs.Operation.GET, datapoints)
-    return result
+def createGetProtocolDataAPDU(datapoints, buf):
+    return createAPDUNoData(defs.APDUClass.PROTOCOL_DATA, defs.Operation.GET, datapoints, buf)
 
-class Header(object):
-    def __init__(self, startDelimiter, destAddr, sourceAddr):
-        self.startDelimiter = startDelimiter
-        self.destAddr = destAddr
-        self.sourceAddr = sourceAddr
+class Header(NamedTuple):
+    # A tuple-backed header skips the per-instance __dict__ a plain
+    # class would allocate for every PDU built
+    startDelimiter: int
+    destAddr: int
+    sourceAddr: int
+
+# Frame header: SD, length, destination, source — packed in one C call
+_FRAME_HEADER = struct.Struct("BBBB")
 
 def createGetValuesPDU(klass, header, protocolData = [], measurements = [], parameter = [], references = [], strings = []):
     if not isinstance(header, Header):
         raise TypeError('Parameter "header" must be of type "Header".')
 
-    length = 2
-    pdu = bytearray()
-
-    if protocolData:
-        protocolAPDU = createGetProtocolDataAPDU(protocolData)
-        length += len(protocolAPDU)
-
-    if measurements:
-        measurementAPDU = createGetMeasuredDataAPDU(klass, measurements)
-        length += len(measurementAPDU)
-
-    if parameter:
-        parameterAPDU = createGetParametersAPDU(parameter)
-        length += len(parameterAPDU)
-
-    if references:
-        referencesAPDU = createGetReferencesAPDU(references)
-        length += len(referencesAPDU)
-
-    if strings:
-        stringsAPDU = createGetStringsAPDU(strings)
-        length += len(stringsAPDU )
+    length = 2 + sum(
+        2 + len(datapoints)
+        for datapoints in (protocolData, measurements, parameter, references, strings)
+        if datapoints
+    )
 
-    pdu.extend([header.startDelimiter, length, header.destAddr, header.sourceAddr])
+    pdu = bytearray(_FRAME_HEADER.pack(header.startDelimiter, length, header.destAddr, header.sourceAddr))
 
     if protocolData:
-        pdu.extend(protocolAPDU)
+        createGetProtocolDataAPDU(protocolData, pdu)
 
     if parameter:
-        pdu.extend(parameterAPDU)
+        createGetParametersAPDU(parameter, pdu)
 
     if measurements:
-        pdu.extend(measurementAPDU)
+        createGetMeasuredDataAPDU(klass, measurements, pdu)
 
     if references:
-        pdu.extend(referencesAPDU)
+        createGetReferencesAPDU(references, pdu)
 
     if strings:
-        pdu.extend(stringsAPDU)
+        createGetStringsAPDU(strings, pdu)
 
     pdu = crc.append_tel(pdu)
 
@@ -183,24 +188,19 @@ def createSetValuesPDU(header, parameter = [], references = []):
     if not isinstance(header, Header):
         raise TypeError('Parameter "header" must be of type "Header".')
 
-    length = 2
-    pdu = bytearray()
-
-    if parameter:
-        parameterAPDU = createSetParametersAPDU(parameter)
-        length += len(parameterAPDU)
-
-    if references:
-        referencesAPDU = createSetReferencesAPDU(references)
-        length += len(referencesAPDU)
+    length = 2 + sum(
+        2 + 2 * len(datapoints)
+        for datapoints in (parameter, references)
+        if datapoints
+    )
 
-    pdu.extend([header.startDelimiter, length, header.destAddr, header.sourceAddr])
+    pdu = bytearray(_FRAME_HEADER.pack(header.startDelimiter, length, header.destAddr, header.sourceAddr))
 
     if parameter:
-        pdu.extend(parameterAPDU)
+        createSetParametersAPDU(parameter, pdu)
 
     if references:
-        pdu.extend(referencesAPDU)
+        createSetReferencesAPDU(references, pdu)
 
     pdu = crc.append_tel(pdu)
 
@@ -211,33 +211,25 @@ def createGetInfoPDU(klass, header, measurements = [], parameter = [], reference
     if not isinstance(header, Header):
         raise TypeError('Parameter "header" must be of type "Header".')
 
-    length = 2
-    pdu = bytearray()
-    if measurements:
-        if klass == defs.APDUClass.MEASURED_DATA:
-            measurementsAPDU = createGetInfoAPDU(defs.APDUClass.MEASURED_DATA, measurements)
-        if klass == defs.APDUClass.SIXTEENBIT_MEASURED_DATA:
-            measurementsAPDU = createGetInfoAPDU(defs.APDUClass.SIXTEENBIT_MEASURED_DATA, measurements)
-        length += len(measurementsAPDU)
-
-    if parameter:
-        parameterAPDU = createGetInfoAPDU(defs.APDUClass.CONFIGURATION_PARAMETERS, parameter)
-        length += len(parameterAPDU)
-
-    if references:
-        referencesAPDU = createGetInfoAPDU(defs.APDUClass.REFERENCE_VALUES, references)
-        length += len(referencesAPDU)
+    length = 2 + sum(
+        2 + len(datapoints)
+        for datapoints in (measurements, parameter, references)
+        if datapoints
+    )
 
-    pdu.extend([header.startDelimiter, length, header.destAddr, header.sourceAddr])
+    pdu = bytearray(_FRAME_HEADER.pack(header.startDelimiter, length, header.destAddr, header.sourceAddr))
 
     if measurements:
-        pdu.extend(measurementsAPDU)
+        if klass == defs.APDUClass.MEASURED_DATA:
+            createGetInfoAPDU(defs.APDUClass.MEASURED_DATA, measurements, pdu)
+        if klass == defs.APDUClass.SIXTEENBIT_MEASURED_DATA:
+            createGetInfoAPDU(defs.APDUClass.SIXTEENBIT_MEASURED_DATA, measurements, pdu)
 
     if parameter:
-        pdu.extend(parameterAPDU)
+        createGetInfoAPDU(defs.APDUClass.CONFIGURATION_PARAMETERS, parameter, pdu)
 
     if references:
-        pdu.extend(referencesAPDU)
+        createGetInfoAPDU(defs.APDUClass.REFERENCE_VALUES, references, pdu)
 
     pdu = crc.append_tel(pdu)
 
@@ -247,30 +239,32 @@ def createSetCommandsPDU(header, commands):
     if not isinstance(header, Header):
         raise TypeError('Parameter "header" must be of type "Header".')
 
-    length = 2
-    pdu = bytearray()
-
-    commandsAPDU = createSetCommandsAPDU(commands)
-    length += len(commandsAPDU)
+    length = 4 + len(commands)
 
-    pdu.extend([header.startDelimiter, length, header.destAddr, header.sourceAddr])
+    pdu = bytearray(_FRAME_HEADER.pack(header.startDelimiter, length, header.destAddr, header.sourceAddr))
 
-    pdu.extend(commandsAPDU)
+    createSetCommandsAPDU(commands, pdu)
 
     pdu = crc.append_tel(pdu)
 
     return pdu
 
+# These two PDUs are fully determined by the source address, and only a
+# handful of source addresses ever occur per installation — build each
+# variant once and hand out the immutable frame on reconnects for free.
+
+@lru_cache(maxsize=8)
 def createConnectRequestPDU(sourceAddr):
-    return createGetValuesPDU(2,
+    return bytes(createGetValuesPDU(2,
         Header(defs.FrameType.SD_DATA_REQUEST, defs.CONNECTION_REQ_ADDR, sourceAddr),
         measurements =  ['unit_family', 'unit_type'],
         protocolData =  ['buf_len', 'unit_bus_mode'],
-        parameter =     ['unit_addr',  'group_addr']                              
-    )
+        parameter =     ['unit_addr',  'group_addr']
+    ))
 
+@lru_cache(maxsize=8)
 def createSetRemotePDU(sourceAddr):
-    return createSetCommandsPDU(
+    return bytes(createSetCommandsPDU(
         Header(defs.FrameType.SD_DATA_REQUEST, 0x20, sourceAddr),
         commands = ['REMOTE']
-    )
\ No newline at end of file
+    ))
\ No newline at end of file
@@ -1,30 +1,34 @@
 """Base connection class for GENIBus communication."""
-import abc
-import asyncio
 
-class Connection(metaclass=abc.ABCMeta):
-    """Abstract base class for GENIBus connections."""
+class Connection:
+    """Base class for GENIBus connections.
+
+    A plain base class is enough for the two known transports
+    (SerialPort, TcpClient); ABCMeta would only add metaclass and
+    isinstance machinery on top.
+    """
 
     def __init__(self):
         self._reader = None
         self._writer = None
 
-    @abc.abstractmethod
     async def connect(self):
         """Establish connection to the device."""
-        pass
+        raise NotImplementedError
 
-    @abc.abstractmethod
     async def disconnect(self):
         """Close connection to the device."""
-        pass
+        raise NotImplementedError
 
-    @abc.abstractmethod
     async def write(self, data):
         """Write data to the device."""
-        pass
+        raise NotImplementedError
+
+    async def read(self, size):
+        """Read up to ``size`` bytes from the device.
 
-    @abc.abstractmethod
-    async def read(self, size=1):
-        """Read data from the device."""
-        pass
\ No newline at end of file
+        Callers reading protocol frames should prefer exact-length reads
+        (``read_exact``) driven by the telegram length field over looping
+        on small reads.
+        """
+        raise NotImplementedError
@@ -5,6 +5,7 @@ import serial
 import serial_asyncio
 
 from .connection import Connection
+from .. import gbdefs
 from ..exceptions import ConnectionError as CU300ConnectionError
 
 _LOGGER = logging.getLogger(__name__)
@@ -42,17 +43,27 @@ class SerialPort(Connection):
         _LOGGER.debug("Connecting to serial port %s", self._port)
         
         try:
-            self._reader, self._writer = await asyncio.wait_for(
-                serial_asyncio.open_serial_connection(
+            async with asyncio.timeout(10):
+                self._reader, self._writer = await serial_asyncio.open_serial_connection(
                     url=self._port,
                     baudrate=self._baudrate,
                     bytesize=self._bytesize,
                     parity=self._parity,
                     stopbits=self._stopbits,
                     timeout=self._timeout,
-                ),
-                timeout=10,
-            )
+                    # GENIBus frames top out at MAX_PDU_LEN + 4 bytes;
+                    # the StreamReader default of 64 KiB just oversizes
+                    # the internal buffer
+                    limit=256,
+                )
+            # A whole frame fits below the high-water mark, so drain()
+            # after a normal write returns without suspending instead of
+            # waiting on the transport's flow-control wakeup
+            transport = self._writer.transport
+            if transport is not None:
+                transport.set_write_buffer_limits(
+                    high=gbdefs.MAX_PDU_LEN, low=0
+                )
             _LOGGER.info("Connected to serial port %s", self._port)
             
         except asyncio.TimeoutError as err:
@@ -74,7 +85,8 @@ class SerialPort(Connection):
         if self._writer:
             try:
                 self._writer.close()
-                await asyncio.wait_for(self._writer.wait_closed(), timeout=5)
+                async with asyncio.timeout(5):
+                    await self._writer.wait_closed()
                 _LOGGER.info("Disconnected from %s", self._port)
                 
             except asyncio.TimeoutError:
@@ -91,12 +103,24 @@ class SerialPort(Connection):
         """Write data to serial port."""
         if not self._writer:
             raise CU300ConnectionError("Serial port not connected")
-        
-        _LOGGER.debug("Writing to %s: %s", self._port, data.hex())
-        
+
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Writing to %s: %s", self._port, data.hex())
+
         try:
-            self._writer.write(bytes(data))
-            await asyncio.wait_for(self._writer.drain(), timeout=5)
+            # The cached PDUs are already immutable bytes; only copy
+            # mutable buffers
+            buf = data if isinstance(data, (bytes, memoryview)) else bytes(data)
+            self._writer.write(buf)
+            # Small GENIBus frames are usually handed to the port in one
+            # go; drain() would just be an extra event-loop round-trip.
+            # Only await it when the transport actually buffered data.
+            # The half-duplex read that follows every write provides
+            # backpressure either way.
+            transport = self._writer.transport
+            if transport is None or transport.get_write_buffer_size() > 0:
+                async with asyncio.timeout(5):
+                    await self._writer.drain()
             _LOGGER.debug("Write completed to %s", self._port)
             
         except asyncio.TimeoutError as err:
@@ -107,7 +131,7 @@ class SerialPort(Connection):
             _LOGGER.error("Write error on %s: %s", self._port, err)
             raise CU300ConnectionError(f"Write error: {err}") from err
 
-    async def read(self, size: int = 1) -> bytes:
+    async def read(self, size: int) -> bytes:
         """Read data from serial port.
         
         Note: This is kept for compatibility but protocol.py should use
@@ -117,13 +141,14 @@ class SerialPort(Connection):
             raise CU300ConnectionError("Serial port not connected")
         
         _LOGGER.debug("Reading %d bytes from %s", size, self._port)
-        
+
         try:
-            data = await asyncio.wait_for(
-                self._reader.read(size),
-                timeout=self._timeout,
-            )
-            _LOGGER.debug("Read from %s: %s", self._port, data.hex())
+            async with asyncio.timeout(self._timeout):
+                data = await self._reader.read(size)
+            # Same deal as write(): don't hex-encode unless the record
+            # will actually be emitted
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("Read from %s: %s", self._port, data.hex())
             return data
             
         except asyncio.TimeoutError:
@@ -140,10 +165,8 @@ class SerialPort(Connection):
             raise CU300ConnectionError("Serial port not connected")
         
         try:
-            data = await asyncio.wait_for(
-                self._reader.readexactly(size),
-                timeout=self._timeout,
-            )
+            async with asyncio.timeout(self._timeout):
+                data = await self._reader.readexactly(size)
             return data
             
         except asyncio.IncompleteReadError as err:
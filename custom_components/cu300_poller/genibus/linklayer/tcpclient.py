@@ -1,6 +1,8 @@
 import logging
 import asyncio
+import socket
 from .connection import Connection
+from ..exceptions import ConnectionError as CU300ConnectionError
 
 _logger = logging.getLogger(__name__)
 
@@ -14,7 +16,29 @@ class TcpClient(Connection):
 
     async def connect(self):
         try:
-            self._reader, self._writer = await asyncio.open_connection(self._host, self._port)
+            # Build and configure the socket before connecting so the
+            # options apply from the very first segment.
+            # GENIBus frames are tiny; without TCP_NODELAY Nagle can hold
+            # them back for up to 40ms waiting for more data. Keepalive
+            # so a silently dropped peer is detected instead of every
+            # poll stalling for its full timeout forever.
+            loop = asyncio.get_running_loop()
+            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            try:
+                sock.setblocking(False)
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+                if hasattr(socket, 'TCP_KEEPIDLE'):
+                    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 15)
+                if hasattr(socket, 'TCP_KEEPINTVL'):
+                    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, 5)
+                if hasattr(socket, 'TCP_KEEPCNT'):
+                    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPCNT, 3)
+                await loop.sock_connect(sock, (self._host, self._port))
+            except BaseException:
+                sock.close()
+                raise
+            self._reader, self._writer = await asyncio.open_connection(sock=sock)
         except Exception as e:
             _logger.error(f"Failed to connect to {self._host}:{self._port}: {e}")
             raise
@@ -26,12 +50,39 @@ class TcpClient(Connection):
         self._reader = None
         self._writer = None
 
+    def _drain_needed(self):
+        # A GENIBus frame normally fits the socket buffer outright, so
+        # drain() would just be an event-loop round-trip per write; only
+        # await it when the transport actually buffered data. The
+        # half-duplex reply read that follows every write provides
+        # backpressure regardless.
+        transport = self._writer.transport
+        return transport is None or transport.get_write_buffer_size() > 0
+
     async def write(self, data):
-        if self._writer:
+        if not self._writer:
+            return
+        try:
             self._writer.write(data)
-            await self._writer.drain()
+            if self._drain_needed():
+                await self._writer.drain()
+        except (ConnectionResetError, BrokenPipeError):
+            # Peer went away since the last poll; reconnect and retry once
+            _logger.warning(f"Connection to {self._host}:{self._port} lost, reconnecting")
+            await self.connect()
+            self._writer.write(data)
+            if self._drain_needed():
+                await self._writer.drain()
+
+    async def read(self, size):
+        if not self._reader:
+            raise CU300ConnectionError("Not connected")
+        return await self._reader.read(size)
 
-    async def read(self, size=1):
-        if self._reader:
-            return await self._reader.read(size)
-        return bytearray()
\ No newline at end of file
+    async def read_exact(self, size):
+        # readexactly pulls the requested span in one buffered call, so
+        # frame reads cost two awaits (header, then body+CRC) instead of
+        # one per byte
+        if not self._reader:
+            raise CU300ConnectionError("Not connected")
+        return await self._reader.readexactly(size)
\ No newline at end of file
@@ -1,12 +1,12 @@
 """High-level protocol handler for CU300 using GENIBus."""
 import asyncio
 import logging
+import struct
 from typing import Any
 
 from .linklayer.serialport import SerialPort
 from .linklayer.tcpclient import TcpClient
 from .apdu import (
-    APDU,
     Header,
     createConnectRequestPDU,
     createGetValuesPDU,
@@ -20,6 +20,20 @@ from .exceptions import ProtocolError, ConnectionError as CU300ConnectionError
 
 _LOGGER = logging.getLogger(__name__)
 
+# Single omnibus request covering every value that _parse_response
+# extracts. When adding measurements, extend this list — the link is
+# half-duplex, so a second request would cost a full extra round-trip.
+_POLL_MEASUREMENTS = ['h', 'q', 'speed_hi', 'p', 'act_mode1', 'alarm_code']
+
+# Valid start delimiters for received frames
+_FRAME_START_BYTES = frozenset(
+    (
+        gbdefs.FrameType.SD_DATA_REQUEST,
+        gbdefs.FrameType.SD_DATA_REPLY,
+        gbdefs.FrameType.SD_DATA_MESSAGE,
+    )
+)
+
 
 class CU300Protocol:
     """High-level protocol handler for CU300."""
@@ -31,17 +45,78 @@ class CU300Protocol:
         port: str | None = None,
         device_addr: int = 0x20,
         source_addr: int = 0x04,
+        baudrate: int = 9600,
     ) -> None:
         """Initialize protocol handler."""
         self._connection_type = connection_type
         self._host = host
         self._port = port
+        self._baudrate = baudrate
         self._device_addr = device_addr
         self._source_addr = source_addr
         self._connection = None
         self._lock = asyncio.Lock()
+        # Result of the poll currently on the wire, shared by every
+        # caller that arrives while it is pending (see poll_data)
+        self._poll_future: asyncio.Future[dict[str, Any]] | None = None
+        # Receive buffer reused across frames; _read_frame hands out
+        # memoryview slices of it, valid until the next read. The link
+        # is half-duplex and reads happen under the lock, so only one
+        # frame is ever live at a time.
+        self._rx_buf = bytearray(gbdefs.MAX_PDU_LEN + 4)
         self._device_db = DeviceDB()
-        
+        # Precompute where each polled value sits in the reply so the
+        # parse hot path is a table walk instead of constructing a full
+        # APDU object per frame. Replies carry the measured-data items
+        # in device-DB order starting after the 4-byte header.
+        dataitems = self._device_db.dataitemsByClass(
+            "magna", gbdefs.APDUClass.MEASURED_DATA
+        )
+        names = {
+            'h': 'head',
+            'q': 'flow',
+            'speed_hi': 'speed',
+            'p': 'power',
+            'act_mode1': 'act_mode1',
+            'alarm_code': 'alarm_code',
+        }
+        self._poll_layout = tuple(
+            (names[item], 4 + position)
+            for position, item in enumerate(dataitems)
+            if item in names
+        )
+        # Full-length replies have a fixed shape, so compile a Struct
+        # (pad bytes skip the header and any interleaved items) and
+        # decode them in one C call; short replies fall back to the
+        # per-offset walk above.
+        self._poll_names = tuple(name for name, _ in self._poll_layout)
+        fmt = ['>']
+        pos = 0
+        for _, offset in self._poll_layout:
+            if offset > pos:
+                fmt.append(f'{offset - pos}x')
+            fmt.append('B')
+            pos = offset + 1
+        self._poll_struct = struct.Struct(''.join(fmt))
+        # All request frames except set_reference are fully determined by
+        # the configured addresses; build (and CRC) them once so the poll
+        # hot path is just a write and a frame read.
+        self._connect_pdu = bytes(createConnectRequestPDU(source_addr))
+        header = Header(
+            gbdefs.FrameType.SD_DATA_REQUEST,
+            device_addr,
+            source_addr,
+        )
+        self._poll_pdu = bytes(
+            createGetValuesPDU(
+                klass=gbdefs.APDUClass.MEASURED_DATA,
+                header=header,
+                measurements=_POLL_MEASUREMENTS,
+            )
+        )
+        self._start_pdu = bytes(createSetCommandsPDU(header, commands=['REMOTE', 'START']))
+        self._stop_pdu = bytes(createSetCommandsPDU(header, commands=['STOP']))
+
         _LOGGER.debug(
             "Initialized CU300Protocol: type=%s, host=%s, port=%s",
             connection_type,
@@ -62,15 +137,15 @@ class CU300Protocol:
             else:
                 if not self._port:
                     raise CU300ConnectionError("Port required for serial connection")
-                self._connection = SerialPort(self._port)
+                self._connection = SerialPort(self._port, baudrate=self._baudrate)
 
             # Establish connection
-            await asyncio.wait_for(self._connection.connect(), timeout=10)
+            async with asyncio.timeout(10):
+                await self._connection.connect()
             _LOGGER.debug("Physical connection established")
 
-            # Send connect request using APDU helper
-            connect_pdu = createConnectRequestPDU(self._source_addr)
-            response = await self._send_and_receive(connect_pdu)
+            # Send the prebuilt connect request
+            response = await self._send_and_receive(self._connect_pdu)
             
             if not response:
                 raise ProtocolError("No response to connect request")
@@ -98,6 +173,24 @@ class CU300Protocol:
             finally:
                 self._connection = None
 
+    async def ping(self) -> bool:
+        """Check whether the existing link still answers.
+
+        Sends the prebuilt connect request with a short deadline; a
+        reply means a transient blip left the transport usable and the
+        caller can skip the full teardown/handshake cycle.
+        """
+        if self._connection is None:
+            return False
+        try:
+            async with self._lock:
+                async with asyncio.timeout(2):
+                    await self._connection.write(self._connect_pdu)
+                    await self._read_frame()
+            return True
+        except Exception:
+            return False
+
     async def reconnect(self) -> None:
         """Reconnect to the device."""
         _LOGGER.info("Attempting reconnection")
@@ -106,35 +199,37 @@ class CU300Protocol:
         await self.connect()
 
     async def poll_data(self) -> dict[str, Any]:
-        """Poll measured data from the device."""
-        async with self._lock:
+        """Poll measured data from the device.
+
+        Every caller wants the same snapshot, so concurrent calls share
+        one in-flight request: the first does the bus round-trip and the
+        rest await its result instead of queueing redundant polls on the
+        lock. Commands (start/stop/set_reference) still serialize
+        against the poll through the lock.
+        """
+        if self._poll_future is not None:
+            # Shield so a cancelled waiter does not kill the exchange
+            # for the others
+            return await asyncio.shield(self._poll_future)
+
+        future: asyncio.Future[dict[str, Any]] = (
+            asyncio.get_running_loop().create_future()
+        )
+        self._poll_future = future
+        try:
             try:
-                # Create data request PDU using APDU helpers
-                header = Header(
-                    gbdefs.FrameType.SD_DATA_REQUEST,
-                    self._device_addr,
-                    self._source_addr,
-                )
-                
-                # Request key measurements
-                measurements = ['h', 'q', 'speed', 'act_mode1', 'alarm_code']
-                
-                pdu = createGetValuesPDU(
-                    klass=gbdefs.APDUClass.MEASURED_DATA,
-                    header=header,
-                    measurements=measurements,
-                )
-                
-                response = await self._send_and_receive(pdu)
-                
+                # Only the bus exchange needs the lock. Parsing is
+                # synchronous CPU work that finishes before any lock
+                # waiter can resume, so the shared receive buffer is
+                # still intact outside the critical section.
+                async with self._lock:
+                    response = await self._send_and_receive(self._poll_pdu)
+
                 if not response:
                     raise ProtocolError("No response received")
 
-                # Parse response
                 data = self._parse_response(response)
                 _LOGGER.debug("Parsed data: %s", data)
-                
-                return data
 
             except asyncio.TimeoutError as err:
                 _LOGGER.error("Timeout polling data")
@@ -142,145 +237,144 @@ class CU300Protocol:
             except Exception as err:
                 _LOGGER.error("Error polling data: %s", err)
                 raise
+        except BaseException as err:
+            future.set_exception(err)
+            # Mark the exception retrieved in case there are no waiters
+            future.exception()
+            raise
+        else:
+            future.set_result(data)
+            return data
+        finally:
+            self._poll_future = None
 
     async def start_pump(self) -> None:
         """Start the pump."""
-        async with self._lock:
-            try:
-                header = Header(
-                    gbdefs.FrameType.SD_DATA_REQUEST,
-                    self._device_addr,
-                    self._source_addr,
-                )
-                
-                pdu = createSetCommandsPDU(header, commands=['REMOTE', 'START'])
-                
-                response = await self._send_and_receive(pdu)
-                
-                if not response:
-                    raise ProtocolError("No response to start command")
-                
-                _LOGGER.info("Pump started successfully")
+        try:
+            async with self._lock:
+                response = await self._send_and_receive(self._start_pdu)
 
-            except Exception as err:
-                _LOGGER.error("Failed to start pump: %s", err)
-                raise ProtocolError(f"Failed to start pump: {err}") from err
+            if not response:
+                raise ProtocolError("No response to start command")
+
+            _LOGGER.info("Pump started successfully")
+
+        except Exception as err:
+            _LOGGER.error("Failed to start pump: %s", err)
+            raise ProtocolError(f"Failed to start pump: {err}") from err
 
     async def stop_pump(self) -> None:
         """Stop the pump."""
-        async with self._lock:
-            try:
-                header = Header(
-                    gbdefs.FrameType.SD_DATA_REQUEST,
-                    self._device_addr,
-                    self._source_addr,
-                )
-                
-                pdu = createSetCommandsPDU(header, commands=['STOP'])
-                
-                response = await self._send_and_receive(pdu)
-                
-                if not response:
-                    raise ProtocolError("No response to stop command")
-                
-                _LOGGER.info("Pump stopped successfully")
+        try:
+            async with self._lock:
+                response = await self._send_and_receive(self._stop_pdu)
 
-            except Exception as err:
-                _LOGGER.error("Failed to stop pump: %s", err)
-                raise ProtocolError(f"Failed to stop pump: {err}") from err
+            if not response:
+                raise ProtocolError("No response to stop command")
+
+            _LOGGER.info("Pump stopped successfully")
+
+        except Exception as err:
+            _LOGGER.error("Failed to stop pump: %s", err)
+            raise ProtocolError(f"Failed to stop pump: {err}") from err
 
     async def set_reference(self, value: int) -> None:
         """Set reference value (0-100%)."""
         if not 0 <= value <= 100:
             raise ValueError("Reference value must be between 0 and 100")
 
-        async with self._lock:
-            try:
-                header = Header(
-                    gbdefs.FrameType.SD_DATA_REQUEST,
-                    self._device_addr,
-                    self._source_addr,
-                )
-                
-                pdu = createSetValuesPDU(
-                    header,
-                    references=[('ref', value)],
-                )
-                
+        # Build (and CRC) the frame before taking the lock so the
+        # critical section is just the bus exchange
+        header = Header(
+            gbdefs.FrameType.SD_DATA_REQUEST,
+            self._device_addr,
+            self._source_addr,
+        )
+        pdu = createSetValuesPDU(
+            header,
+            references=[('ref', value)],
+        )
+
+        try:
+            async with self._lock:
                 response = await self._send_and_receive(pdu)
-                
-                if not response:
-                    raise ProtocolError("No response to set reference")
-                
-                _LOGGER.info("Reference set to %s%%", value)
 
-            except Exception as err:
-                _LOGGER.error("Failed to set reference: %s", err)
-                raise ProtocolError(f"Failed to set reference: {err}") from err
+            if not response:
+                raise ProtocolError("No response to set reference")
+
+            _LOGGER.info("Reference set to %s%%", value)
 
-    async def _send_and_receive(self, pdu: bytearray) -> bytearray:
+        except Exception as err:
+            _LOGGER.error("Failed to set reference: %s", err)
+            raise ProtocolError(f"Failed to set reference: {err}") from err
+
+    async def _send_and_receive(self, pdu: bytes | bytearray) -> memoryview:
         """Send PDU and receive response."""
         if not self._connection:
             raise CU300ConnectionError("Not connected")
 
-        # PDU should already have CRC from APDU functions, but verify
-        if not crc.check_tel(pdu, silent=True):
-            pdu = crc.append_tel(pdu)
+        # Every PDU reaching this point comes from a createXxxPDU helper
+        # and already carries its CRC; re-scanning the buffer on every
+        # send would be wasted work.
+
+        # .hex() allocates a string even when debug logging is off; only
+        # pay for it when the record will actually be emitted
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Sending PDU: %s", pdu.hex())
 
-        _LOGGER.debug("Sending PDU: %s", pdu.hex())
-        
         try:
-            await self._connection.write(pdu)
-            response = await asyncio.wait_for(
-                self._read_frame(),
-                timeout=5,
-            )
-            _LOGGER.debug("Received response: %s", response.hex())
+            # One timeout scope for the whole exchange instead of separate
+            # write and read deadlines
+            async with asyncio.timeout(5):
+                await self._connection.write(pdu)
+                response = await self._read_frame()
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("Received response: %s", response.hex())
             return response
 
         except asyncio.TimeoutError as err:
             _LOGGER.error("Timeout waiting for response")
             raise ProtocolError("Response timeout") from err
 
-    async def _read_frame(self) -> bytearray:
-        """Read a complete GENIBus frame."""
-        if not self._connection or not self._connection._reader:
+    async def _read_frame(self) -> memoryview:
+        """Read a complete GENIBus frame into the reusable buffer.
+
+        Returns a memoryview into ``self._rx_buf``; it stays valid only
+        until the next frame is read.
+        """
+        if not self._connection:
             raise CU300ConnectionError("No active connection")
 
-        # Read start delimiter
-        start = await self._connection._reader.read(1)
-        if not start:
+        # Start delimiter and length always arrive together; fetch both
+        # with one exact read instead of two byte-sized reads
+        header = await self._connection.read_exact(2)
+        if len(header) < 2:
             raise ProtocolError("No data received")
 
-        start_byte = start[0]
-        if start_byte not in [
-            gbdefs.FrameType.SD_DATA_REQUEST,
-            gbdefs.FrameType.SD_DATA_REPLY,
-            gbdefs.FrameType.SD_DATA_MESSAGE,
-        ]:
+        start_byte = header[0]
+        if start_byte not in _FRAME_START_BYTES:
             raise ProtocolError(f"Invalid start delimiter: 0x{start_byte:02x}")
 
-        # Read length byte
-        length_data = await self._connection._reader.read(1)
-        if not length_data:
-            raise ProtocolError("Failed to read length byte")
-        
-        length = length_data[0]
-        
+        length = header[1]
+
         if length > gbdefs.MAX_PDU_LEN:
             raise ProtocolError(f"Invalid frame length: {length}")
 
-        # Read remaining data (length + 2 for CRC)
+        # Read remaining data (length + 2 for CRC) in a single exact read
         remaining_length = length + 2
-        remaining = await self._connection._reader.read(remaining_length)
-        
+        remaining = await self._connection.read_exact(remaining_length)
+
         if len(remaining) != remaining_length:
             raise ProtocolError(
                 f"Incomplete frame: expected {remaining_length}, got {len(remaining)}"
             )
 
-        # Assemble complete frame
-        frame = start + length_data + remaining
+        # Assemble the frame in the reused buffer instead of
+        # concatenating fresh bytes objects for every poll
+        buf = self._rx_buf
+        buf[0:2] = header
+        buf[2:2 + remaining_length] = remaining
+        frame = memoryview(buf)[:2 + remaining_length]
 
         # Verify CRC
         if not crc.check_tel(frame, silent=True):
@@ -288,27 +382,30 @@ class CU300Protocol:
 
         return frame
 
-    def _parse_response(self, response: bytearray) -> dict[str, Any]:
+    def _parse_response(self, response: memoryview) -> dict[str, Any]:
         """Parse response frame into data dictionary."""
+        # Smallest valid telegram: 4 header bytes + 2 CRC bytes. Anything
+        # shorter is noise; reject before spending CRC/APDU work on it.
+        if len(response) < 6:
+            raise ProtocolError(f"Response too short: {len(response)} bytes")
+
         try:
-            apdu = APDU.from_bytes(response)
-            
-            if not apdu:
-                raise ProtocolError("Failed to parse APDU")
-
-            # Extract values with proper naming
-            data = {
-                'head': apdu.get_value('h'),
-                'flow': apdu.get_value('q'),
-                'speed': apdu.get_value('speed'),
-                'power': apdu.get_value('p'),
-                'act_mode1': apdu.get_value('act_mode1'),
-                'alarm_code': apdu.get_value('alarm_code'),
+            # CRC was already verified in _read_frame; decode straight
+            # off the precomputed layout. Values past the end of a short
+            # reply are simply absent, matching the old get_value
+            # None-filtering.
+            size = len(response)
+            if size > self._poll_struct.size:
+                # Expected shape: unpack every value in one C call
+                return dict(
+                    zip(self._poll_names, self._poll_struct.unpack_from(response))
+                )
+            return {
+                name: response[offset]
+                for name, offset in self._poll_layout
+                if offset + 1 < size
             }
 
-            # Filter out None values
-            return {k: v for k, v in data.items() if v is not None}
-
         except Exception as err:
             _LOGGER.error("Error parsing response: %s", err)
             raise ProtocolError(f"Failed to parse response: {err}") from err
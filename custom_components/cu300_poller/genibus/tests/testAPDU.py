@@ -47,6 +47,14 @@ class TestAPDUs(unittest.TestCase):
         self.assertEqual(self.toHex(apdu.createSetValuesPDU(apdu.Header(defs.FrameType.SD_DATA_REQUEST, 0x20, 0x01), references = [('ref_rem', 0xa5, )])),
                          [0x27, 0x06, 0x20, 0x01, 0x05, 0x82, 0x01, 0xa5, 0x0f, 0x4c])
 
+    def testFromBytesRejectsTruncatedFrame(self):
+        # A frame must span length byte + 4 octets (SD, length, payload,
+        # CRC); anything shorter is rejected before the CRC pass.
+        pdu = apdu.createConnectRequestPDU(0x01)
+        self.assertIsNone(apdu.APDU.from_bytes(pdu[:4]))
+        self.assertIsNone(apdu.APDU.from_bytes(pdu[:-2]))
+        self.assertIsNotNone(apdu.APDU.from_bytes(pdu))
+
     def testGetInfoPDU(self):
         self.assertEqual(self.toHex(apdu.createGetInfoPDU(klass = defs.APDUClass.MEASURED_DATA,
             header = apdu.Header(defs.FrameType.SD_DATA_REQUEST, 0x20, 0x01),
@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+__version__ = "0.1.0"
+
+__copyright__ = """
+Grundfos GENIBus Library.
+
+(C) 2007-2017 by Christoph Schueler <github.com/Christoph2,
+                                     cpu12.gems@googlemail.com>
+
+ All Rights Reserved
+
+This program is free software; you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation; either version 2 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License along
+with this program; if not, write to the Free Software Foundation, Inc.,
+51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+"""
+
+import unittest
+
+import genibus.gbdefs as defs
+
+# The protocol module pulls in the serial transport, whose dependencies
+# (pyserial/serial_asyncio) may not be installed where the pure-Python
+# tests run; skip rather than fail in that case.
+try:
+    from genibus.protocol import CU300Protocol
+except ImportError:
+    CU300Protocol = None
+
+
+@unittest.skipIf(CU300Protocol is None, "transport dependencies not installed")
+class TestCU300Protocol(unittest.TestCase):
+
+    def testConstructor(self):
+        # Smoke test: the constructor precomputes the poll layout and
+        # request frames without touching any transport.
+        protocol = CU300Protocol(connection_type="tcp", host="localhost", port=502)
+        self.assertEqual(protocol._poll_pdu[0], defs.FrameType.SD_DATA_REQUEST)
+        self.assertEqual(
+            sorted(protocol._poll_names),
+            ['act_mode1', 'alarm_code', 'flow', 'head', 'power', 'speed'],
+        )
+        self.assertEqual(len(protocol._poll_layout), len(protocol._poll_names))
+
+
+def main():
+    unittest.main()
+
+if __name__ == '__main__':
+    main()
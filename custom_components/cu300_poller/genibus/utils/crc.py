@@ -31,16 +31,31 @@ with this program; if not, write to the Free Software Foundation, Inc.,
 class CrcError(Exception):
     pass
 
-def calc_raw(_bytes):
-    return binascii.crc_hqx(bytearray(_bytes), 0xffff) ^ 0xffff
+_crc_hqx = binascii.crc_hqx
+
+def calc_raw(_bytes, _crc=_crc_hqx, _buffer_types=(bytes, bytearray, memoryview)):
+    # crc_hqx is a table-driven CRC-CCITT in C; feed it buffers directly
+    # and only convert inputs (e.g. tuples of ints) that it cannot take.
+    if not isinstance(_bytes, _buffer_types):
+        _bytes = bytes(_bytes)
+    return _crc(_bytes, 0xffff) ^ 0xffff
 
 def append_tel(telegram):
-    crc = calc_raw(telegram[1:])
-    return telegram + bytearray([crc >> 8, crc & 0xff])
+    if isinstance(telegram, (bytes, bytearray, memoryview)):
+        crc = calc_raw(memoryview(telegram)[1:])
+    else:
+        crc = calc_raw(telegram[1:])
+    if isinstance(telegram, bytearray):
+        # Extend in place rather than concatenating into a new buffer
+        telegram.append(crc >> 8)
+        telegram.append(crc & 0xff)
+        return telegram
+    return bytes(telegram) + bytes((crc >> 8, crc & 0xff))
 
 def check_tel(telegram, silent=False):
-    telegram = bytearray(telegram)
-    match = calc_raw(telegram[1:-2]) == (telegram[-2] << 8) + telegram[-1]
+    if not isinstance(telegram, (bytes, bytearray, memoryview)):
+        telegram = bytes(telegram)
+    match = calc_raw(memoryview(telegram)[1:-2]) == (telegram[-2] << 8) + telegram[-1]
     if not match and not silent:
         raise CrcError('Telegram CRC not match!')
     else:
@@ -10,7 +10,7 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
+from .const import DOMAIN, KEY_REFERENCE
 from .coordinator import CU300Coordinator
 
 _LOGGER = logging.getLogger(__name__)
@@ -66,7 +66,7 @@ class CU300ReferenceNumber(CoordinatorEntity[CU300Coordinator], NumberEntity):
             return None
         
         # Get reference value from data (adjust key if needed)
-        ref_value = self.coordinator.data.get('reference')
+        ref_value = self.coordinator.data.get(KEY_REFERENCE)
         return ref_value if ref_value is not None else 50  # Default to 50%
 
     @property
@@ -2,11 +2,11 @@
 from __future__ import annotations
 
 import logging
-from typing import Any
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
     SensorEntity,
+    SensorEntityDescription,
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
@@ -15,66 +15,78 @@ from homeassistant.const import (
     UnitOfVolumeFlowRate,
     UnitOfLength,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
+from .const import (
+    DOMAIN,
+    KEY_ACT_MODE1,
+    KEY_ALARM_CODE,
+    KEY_FLOW,
+    KEY_HEAD,
+    KEY_POWER,
+    KEY_SPEED,
+)
 from .coordinator import CU300Coordinator
 
 _LOGGER = logging.getLogger(__name__)
 
+# Alarm descriptions indexed by code (adjust based on CU300 manual).
+# The codes are dense from zero, so a tuple index beats a dict built
+# per lookup.
+_ALARM_DESCRIPTIONS: tuple[str, ...] = (
+    "No alarm",
+    "Low water level",
+    "High temperature",
+    "Motor overload",
+    "Dry running",
+    "Communication error",
+)
+
 
-SENSOR_TYPES = [
-    {
-        "key": "head",
-        "name": "Head",
-        "icon": "mdi:gauge",
-        "unit": UnitOfLength.METERS,
-        "device_class": None,
-        "state_class": SensorStateClass.MEASUREMENT,
-    },
-    {
-        "key": "flow",
-        "name": "Flow",
-        "icon": "mdi:water-pump",
-        "unit": UnitOfVolumeFlowRate.CUBIC_METERS_PER_HOUR,
-        "device_class": None,
-        "state_class": SensorStateClass.MEASUREMENT,
-    },
-    {
-        "key": "speed",
-        "name": "Speed",
-        "icon": "mdi:speedometer",
-        "unit": PERCENTAGE,
-        "device_class": None,
-        "state_class": SensorStateClass.MEASUREMENT,
-    },
-    {
-        "key": "power",
-        "name": "Power",
-        "icon": "mdi:lightning-bolt",
-        "unit": "W",
-        "device_class": SensorDeviceClass.POWER,
-        "state_class": SensorStateClass.MEASUREMENT,
-    },
-    {
-        "key": "alarm_code",
-        "name": "Alarm Code",
-        "icon": "mdi:alert-circle",
-        "unit": None,
-        "device_class": None,
-        "state_class": None,
-    },
-    {
-        "key": "act_mode1",
-        "name": "Operating Mode",
-        "icon": "mdi:cog",
-        "unit": None,
-        "device_class": None,
-        "state_class": None,
-    },
-]
+SENSOR_TYPES: tuple[SensorEntityDescription, ...] = (
+    SensorEntityDescription(
+        key=KEY_HEAD,
+        name="CU300 Head",
+        icon="mdi:gauge",
+        native_unit_of_measurement=UnitOfLength.METERS,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    SensorEntityDescription(
+        key=KEY_FLOW,
+        name="CU300 Flow",
+        icon="mdi:water-pump",
+        native_unit_of_measurement=UnitOfVolumeFlowRate.CUBIC_METERS_PER_HOUR,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    SensorEntityDescription(
+        key=KEY_SPEED,
+        name="CU300 Speed",
+        icon="mdi:speedometer",
+        native_unit_of_measurement=PERCENTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    SensorEntityDescription(
+        key=KEY_POWER,
+        name="CU300 Power",
+        icon="mdi:lightning-bolt",
+        native_unit_of_measurement="W",
+        device_class=SensorDeviceClass.POWER,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    SensorEntityDescription(
+        key=KEY_ALARM_CODE,
+        name="CU300 Alarm Code",
+        icon="mdi:alert-circle",
+    ),
+    SensorEntityDescription(
+        key=KEY_ACT_MODE1,
+        name="CU300 Operating Mode",
+        icon="mdi:cog",
+    ),
+)
 
 
 async def async_setup_entry(
@@ -85,13 +97,27 @@ async def async_setup_entry(
     """Set up CU300 sensor platform."""
     coordinator: CU300Coordinator = hass.data[DOMAIN][entry.entry_id]
 
-    entities = [
-        CU300Sensor(coordinator, entry, sensor_config)
-        for sensor_config in SENSOR_TYPES
-    ]
+    # One DeviceInfo shared by reference across all sensors; the device
+    # registry treats it as read-only, so sharing is safe
+    device_info = DeviceInfo(
+        identifiers={(DOMAIN, entry.entry_id)},
+        name="Grundfos CU300",
+        manufacturer="Grundfos",
+        model="CU300",
+        sw_version="1.0",
+    )
+
+    # Fixed-size platform: build the entities as a tuple directly
+    entities = tuple(
+        (CU300AlarmSensor if description.key == KEY_ALARM_CODE else CU300Sensor)(
+            coordinator, entry, description, device_info
+        )
+        for description in SENSOR_TYPES
+    )
 
     async_add_entities(entities)
-    _LOGGER.debug("Added %d CU300 sensors", len(entities))
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        _LOGGER.debug("Added %d CU300 sensors", len(entities))
 
 
 class CU300Sensor(CoordinatorEntity[CU300Coordinator], SensorEntity):
@@ -101,57 +127,90 @@ class CU300Sensor(CoordinatorEntity[CU300Coordinator], SensorEntity):
         self,
         coordinator: CU300Coordinator,
         entry: ConfigEntry,
-        sensor_config: dict[str, Any],
+        description: SensorEntityDescription,
+        device_info: DeviceInfo,
     ) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator)
-        self._key = sensor_config["key"]
-        self._attr_name = f"CU300 {sensor_config['name']}"
-        self._attr_unique_id = f"{entry.entry_id}_{self._key}"
-        self._attr_icon = sensor_config["icon"]
-        self._attr_native_unit_of_measurement = sensor_config["unit"]
-        self._attr_device_class = sensor_config["device_class"]
-        self._attr_state_class = sensor_config["state_class"]
-        
-        # Device info for grouping entities
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, entry.entry_id)},
-            "name": "Grundfos CU300",
-            "manufacturer": "Grundfos",
-            "model": "CU300",
-            "sw_version": "1.0",
-        }
-
-    @property
-    def native_value(self) -> Any:
-        """Return the state of the sensor."""
-        if self.coordinator.data is None:
-            return None
-        return self.coordinator.data.get(self._key)
+        # name/icon/unit/device_class/state_class are read straight off
+        # the description by SensorEntity; no per-instance copies needed
+        self.entity_description = description
+        self._attr_unique_id = f"{entry.entry_id}_{description.key}"
+        self._attr_device_info = device_info
+        # Seed the cached value; the coordinator has usually completed
+        # its first refresh before entities are created
+        data = coordinator.data
+        self._attr_native_value = None if data is None else data.get(description.key)
+        self._attr_available = coordinator.last_update_success and coordinator.connected
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Cache the latest value so state reads are attribute loads."""
+        coordinator = self.coordinator
+        data = coordinator.data
+        self._attr_native_value = (
+            None if data is None else data.get(self.entity_description.key)
+        )
+        self._attr_available = (
+            coordinator.last_update_success and coordinator.connected
+        )
+        super()._handle_coordinator_update()
 
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        return self.coordinator.last_update_success and self.coordinator.connected
+        # CoordinatorEntity supplies its own available property, so the
+        # cached flag must be surfaced through an override here
+        return self._attr_available
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any] | None:
-        """Return additional state attributes."""
-        if self._key == "alarm_code" and self.native_value:
-            return {
-                "alarm_description": self._get_alarm_description(self.native_value)
-            }
-        return None
+
+class CU300AlarmSensor(CU300Sensor):
+    """Alarm-code sensor carrying a human-readable description.
+
+    Only this entity has extra attributes, so the lookup lives here
+    instead of a per-write key comparison in the base class. The
+    description is recomputed in the coordinator callback, and only
+    when the code actually changed — state reads just return the
+    cached dict.
+    """
+
+    def __init__(
+        self,
+        coordinator: CU300Coordinator,
+        entry: ConfigEntry,
+        description: SensorEntityDescription,
+        device_info: DeviceInfo,
+    ) -> None:
+        """Initialize the alarm sensor."""
+        super().__init__(coordinator, entry, description, device_info)
+        # Seed like the base class seeds value/availability: the update
+        # callback is not invoked on add, so an alarm active at startup
+        # must get its description here
+        data = coordinator.data
+        code = None if data is None else data.get(KEY_ALARM_CODE)
+        self._last_code: int | None = code
+        self._attr_extra_state_attributes = (
+            {"alarm_description": self._get_alarm_description(code)}
+            if code
+            else None
+        )
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Refresh the cached alarm description on code changes."""
+        data = self.coordinator.data
+        code = None if data is None else data.get(KEY_ALARM_CODE)
+        if code != self._last_code:
+            self._last_code = code
+            self._attr_extra_state_attributes = (
+                {"alarm_description": self._get_alarm_description(code)}
+                if code
+                else None
+            )
+        super()._handle_coordinator_update()
 
     def _get_alarm_description(self, code: int) -> str:
         """Get human-readable alarm description."""
-        # Map alarm codes to descriptions (adjust based on CU300 manual)
-        alarm_map = {
-            0: "No alarm",
-            1: "Low water level",
-            2: "High temperature",
-            3: "Motor overload",
-            4: "Dry running",
-            5: "Communication error",
-        }
-        return alarm_map.get(code, f"Unknown alarm code: {code}")
+        if 0 <= code < len(_ALARM_DESCRIPTIONS):
+            return _ALARM_DESCRIPTIONS[code]
+        return f"Unknown alarm code: {code}"
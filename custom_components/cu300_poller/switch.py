@@ -10,7 +10,7 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
+from .const import DOMAIN, KEY_ACT_MODE1, KEY_ALARM_CODE, KEY_SPEED
 from .coordinator import CU300Coordinator
 
 _LOGGER = logging.getLogger(__name__)
@@ -60,7 +60,7 @@ class CU300PumpSwitch(CoordinatorEntity[CU300Coordinator], SwitchEntity):
             return None
         
         # Check operating mode - adjust based on actual CU300 values
-        act_mode = self.coordinator.data.get('act_mode1')
+        act_mode = self.coordinator.data.get(KEY_ACT_MODE1)
         if act_mode is None:
             return None
         
@@ -93,7 +93,7 @@ class CU300PumpSwitch(CoordinatorEntity[CU300Coordinator], SwitchEntity):
         """Return additional state attributes."""
         if self.coordinator.data:
             return {
-                "speed": self.coordinator.data.get('speed'),
-                "alarm_code": self.coordinator.data.get('alarm_code'),
+                "speed": self.coordinator.data.get(KEY_SPEED),
+                "alarm_code": self.coordinator.data.get(KEY_ALARM_CODE),
             }
         return None